@@ -4,8 +4,18 @@
 # Clean, documented, modular, readable
 # ==============================================
 
-from statistics import mean, median, stdev
-import os
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from statistics import median
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; NumPy/Python paths are used instead
+    njit = None
 
 # ==============================================
 # ======= Helper / Utility Functions ==========
@@ -46,22 +56,278 @@ def get_yes_no(prompt):
         print("Invalid input. Enter 'y' or 'n'.")
 
 
+# Row layout shared by the paper tables; parsed once, printf-style is a
+# fast C path in CPython compared to per-row f-string formatting.
+_ROW_FMT = "%-5d %-35s %10d"
+
+
 def print_paper_list(papers, title="Paper List"):
     """
     Nicely display papers with their citations in tabular format.
+    Builds the whole table in memory and emits it as one write.
     """
     if not papers:
         print(f"\n{title}: No papers to display.\n")
         return
-    print_divider()
-    print(f"{title}".center(60))
-    print_divider()
-    print(f"{'S.No':<5} {'Paper Name':<35} {'Citations':>10}")
-    print_divider('-')
-    for i, (name, cit) in enumerate(papers.items(), start=1):
-        print(f"{i:<5} {name:<35} {cit:>10}")
-    print_divider()
-    print()  # extra spacing
+    lines = [
+        "=" * 60,
+        f"{title}".center(60),
+        "=" * 60,
+        f"{'S.No':<5} {'Paper Name':<35} {'Citations':>10}",
+        "-" * 60,
+    ]
+    lines.extend(_ROW_FMT % (i, name, cit)
+                 for i, (name, cit) in enumerate(papers.items(), start=1))
+    lines.append("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n\n")
+
+
+# ==============================================
+# ======= Statistics Cache ====================
+# ==============================================
+
+_stats_cache = {}
+_papers_version = 0
+
+
+def bump_papers_version():
+    """
+    Mark the paper data as changed so cached statistics get recomputed.
+    Call after any mutation (edit, rename, delete, load, new input).
+    """
+    global _papers_version
+    _papers_version += 1
+
+
+def _cached(key, fn):
+    """
+    Return the statistic stored under 'key' for the current data version.
+    Computes it via fn() and caches it on first request; repeated menu
+    choices then become dictionary lookups instead of full recomputes.
+    """
+    entry = _stats_cache.get(key)
+    if entry is None or entry[0] != _papers_version:
+        entry = (_papers_version, fn())
+        _stats_cache[key] = entry
+    return entry[1]
+
+
+# ==============================================
+# ======= Running Statistics ==================
+# ==============================================
+
+class RunningStats:
+    """
+    Incremental accumulator for count, sum, mean, variance and extrema.
+    Uses Welford's algorithm so each edit, add or delete updates the
+    moments in O(1); the simple menu statistics then read stored values
+    instead of rescanning every paper. Extrema are kept exact through a
+    value multiset: O(1) on insert, recomputed lazily only when the
+    current extremum itself is removed. A Fenwick tree over capped
+    citation buckets additionally maintains the h-index: O(log n) per
+    mutation, O(log^2 n) per query.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._counts = Counter()
+        self._min = None
+        self._max = None
+        self._cap = 16
+        self._fen = array('q', bytes(8 * (self._cap + 2)))
+
+    # ---- Fenwick tree over citation buckets (bucket = min(c, cap)) ----
+    # Capping at cap >= count is lossless for h-index queries because
+    # h can never exceed the number of papers.
+
+    def _bucket(self, c):
+        # Clamp to [0, cap]: a negative bucket would send the Fenwick
+        # update loop spinning forever (i & -i stays 0 at i = 0).
+        return max(0, min(c, self._cap))
+
+    def _fen_add(self, bucket, delta):
+        i = bucket + 1
+        while i < len(self._fen):
+            self._fen[i] += delta
+            i += i & -i
+
+    def _fen_prefix(self, bucket):
+        # Number of stored values <= bucket
+        i = bucket + 1
+        s = 0
+        while i > 0:
+            s += self._fen[i]
+            i -= i & -i
+        return s
+
+    def _fen_rebuild(self):
+        self._cap = max(16, 2 * self.count)
+        self._fen = array('q', bytes(8 * (self._cap + 2)))
+        for c, k in self._counts.items():
+            self._fen_add(self._bucket(c), k)
+
+    def rebuild(self, values):
+        self.reset()
+        for c in values:
+            self.add(c)
+
+    def add(self, c):
+        self.count += 1
+        self.total += c
+        delta = c - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (c - self.mean)
+        self._counts[c] += 1
+        if self.count > self._cap:
+            self._fen_rebuild()
+        else:
+            self._fen_add(self._bucket(c), 1)
+        if self._min is not None and c < self._min:
+            self._min = c
+        if self._max is not None and c > self._max:
+            self._max = c
+
+    def remove(self, c):
+        self._counts[c] -= 1
+        if not self._counts[c]:
+            del self._counts[c]
+        self.count -= 1
+        self.total -= c
+        self._fen_add(self._bucket(c), -1)
+        if self.count == 0:
+            self.mean = 0.0
+            self._m2 = 0.0
+        else:
+            delta = c - self.mean
+            self.mean -= delta / self.count
+            self._m2 -= delta * (c - self.mean)
+            if self._m2 < 0:  # guard against floating-point drift
+                self._m2 = 0.0
+        # Mark the extremum stale only if we removed its last occurrence
+        if c == self._min and c not in self._counts:
+            self._min = None
+        if c == self._max and c not in self._counts:
+            self._max = None
+
+    def update(self, old, new):
+        self.remove(old)
+        self.add(new)
+
+    def minimum(self):
+        if self._min is None and self._counts:
+            self._min = min(self._counts)
+        return self._min
+
+    def maximum(self):
+        if self._max is None and self._counts:
+            self._max = max(self._counts)
+        return self._max
+
+    def h_index(self):
+        """
+        Largest h such that h papers have at least h citations, found by
+        binary search over Fenwick suffix counts.
+        """
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            # papers with at least mid citations
+            if self.count - self._fen_prefix(mid - 1) >= mid:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stdev(self):
+        return self.variance() ** 0.5
+
+
+_running = RunningStats()
+
+
+def get_running_stats(papers):
+    """
+    Return the module's RunningStats, rebuilding it if it has fallen
+    out of sync with the papers dict (e.g. a mutation that bypassed
+    the accumulator hooks).
+    """
+    if _running.count != len(papers):
+        _running.rebuild(papers.values())
+    return _running
+
+
+# ==============================================
+# ======= Columnar Paper Store ================
+# ==============================================
+
+@dataclass
+class PaperStore:
+    """
+    Structure-of-arrays view of a papers dict: parallel NumPy arrays of
+    names and citation counts plus a name -> row index for O(1) lookup.
+    Reductions and filters run as C-level array operations instead of
+    walking the dict and boxing each citation count.
+    """
+    names: np.ndarray
+    cits: np.ndarray
+    _index: dict
+    _u8: np.ndarray = None
+    _u8_checked: bool = False
+    _sorted_cits: np.ndarray = None
+    _sorted_names: np.ndarray = None
+
+    @classmethod
+    def from_papers(cls, papers):
+        names = np.array(list(papers.keys()), dtype=object)
+        cits = np.fromiter(papers.values(), dtype=np.int64, count=len(papers))
+        index = {name: i for i, name in enumerate(papers)}
+        return cls(names, cits, index)
+
+    def packed_u8(self):
+        """
+        Return the citation column packed into uint8 lanes when every
+        count fits in a byte, else None. Byte lanes let the comparison
+        loops process 8x more elements per SIMD vector than int64.
+        """
+        if not self._u8_checked:
+            self._u8_checked = True
+            if self.cits.size and int(self.cits.max()) <= 255:
+                self._u8 = self.cits.astype(np.uint8)
+        return self._u8
+
+    def sorted_view(self):
+        """
+        Return (citations ascending, names in matching order), sorted
+        once per store. Threshold and range queries then run in
+        O(log n) via searchsorted, and Top-N is a tail slice.
+        """
+        if self._sorted_cits is None:
+            order = np.argsort(self.cits, kind='stable')
+            self._sorted_cits = self.cits[order]
+            self._sorted_names = self.names[order]
+        return self._sorted_cits, self._sorted_names
+
+
+def get_paper_store(papers):
+    """
+    Return the PaperStore for the current data version, rebuilding it
+    only after a mutation bumps the version counter.
+    """
+    store = _cached('store', lambda: PaperStore.from_papers(papers))
+    if store.cits.size != len(papers):
+        # A mutation slipped past the version counter; rebuild everything.
+        bump_papers_version()
+        store = _cached('store', lambda: PaperStore.from_papers(papers))
+    return store
 
 
 # ==============================================
@@ -76,6 +342,7 @@ def get_paper_input():
     """
     papers = {}
     count = 1
+    _running.reset()
     print("\nEnter paper names and citations. Type 'done' when finished.\n")
     while True:
         name = input(f"Paper name [{count}]: ").strip()
@@ -84,8 +351,13 @@ def get_paper_input():
         if name == '':
             name = f"Paper {count}"
         citations = get_int(f"Citations for '{name}': ", min_val=0)
+        if name in papers:
+            _running.update(papers[name], citations)
+        else:
+            _running.add(citations)
         papers[name] = citations
         count += 1
+    bump_papers_version()
     return papers
 
 
@@ -94,9 +366,11 @@ def save_papers_to_txt(papers, filename):
     Save paper dictionary to a TXT file in format: Paper Name|Citations.
     """
     try:
-        with open(filename, 'w') as f:
-            for name, cit in papers.items():
-                f.write(f"{name}|{cit}\n")
+        # Build the whole payload first and write it in one call;
+        # per-line writes are dominated by TextIOWrapper overhead.
+        payload = "".join(f"{name}|{cit}\n" for name, cit in papers.items())
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(payload)
         print(f"Papers saved to '{filename}' successfully.\n")
     except Exception as e:
         print(f"Error saving file: {e}\n")
@@ -108,17 +382,29 @@ def load_papers_from_txt(filename):
     Returns a dictionary {name: citations}.
     """
     papers = {}
-    if not os.path.exists(filename):
-        print("File does not exist.\n")
-        return papers
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                if '|' in line:
-                    name, cit = line.strip().split('|', 1)
-                    if cit.isdigit():
-                        papers[name] = int(cit)
+        # Open directly and let a missing file raise: avoids the extra
+        # stat() of an exists() check and the race it invites.
+        # Binary read with a 1 MB buffer skips the TextIOWrapper layer
+        # entirely; decode once instead of per line.
+        with open(filename, 'rb', buffering=1 << 20) as f:
+            data = f.read().decode('utf-8')
+        # partition + try/except parses each row in a single scan instead
+        # of the isdigit-then-int double pass. Negative counts are
+        # rejected: the rest of the module relies on citations >= 0.
+        for line in data.splitlines():
+            name, sep, cit = line.strip().partition('|')
+            if not sep:
+                continue
+            try:
+                value = int(cit)
+            except ValueError:
+                continue
+            if value >= 0:
+                papers[name] = value
         print(f"Papers loaded from '{filename}' successfully.\n")
+    except FileNotFoundError:
+        print("File does not exist.\n")
     except Exception as e:
         print(f"Error loading file: {e}\n")
     return papers
@@ -128,23 +414,101 @@ def load_papers_from_txt(filename):
 # ======= Core Statistics / Analysis ==========
 # ==============================================
 
+def _h_index_kernel(cits):
+    """
+    Counting-bucket h-index over an int64 citation array.
+    Compiled with Numba when available.
+    """
+    n = cits.size
+    buckets = np.zeros(n + 1, np.int64)
+    for i in range(n):
+        c = cits[i]
+        buckets[c if c < n else n] += 1
+    total = 0
+    for i in range(n, 0, -1):
+        total += buckets[i]
+        if total >= i:
+            return i
+    return 0
+
+
+def _outlier_masks_kernel(cits, lo_bound, hi_bound):
+    """
+    Single-pass boolean masks for citations above/below the outlier bounds.
+    Compiled with Numba when available.
+    """
+    n = cits.size
+    hi_mask = np.empty(n, np.bool_)
+    lo_mask = np.empty(n, np.bool_)
+    for i in range(n):
+        c = cits[i]
+        hi_mask[i] = c > hi_bound
+        lo_mask[i] = c < lo_bound
+    return hi_mask, lo_mask
+
+
+if njit is not None:
+    _h_index_kernel = njit(cache=True)(_h_index_kernel)
+    _outlier_masks_kernel = njit(cache=True)(_outlier_masks_kernel)
+
+
+def _outlier_masks(cits, lo_bound, hi_bound):
+    """
+    Return (hi_mask, lo_mask) for the given bounds, via the compiled
+    kernel when Numba is present or two NumPy comparisons otherwise.
+    """
+    if njit is not None:
+        return _outlier_masks_kernel(cits, lo_bound, hi_bound)
+    return cits > hi_bound, cits < lo_bound
+
+
 def h_index(papers):
     """
     Calculate h-index: maximum value h such that h papers have at least h citations.
+    Reads the incrementally maintained value when the running accumulator
+    is in sync; otherwise falls back to an O(n) counting-bucket pass.
+    """
+    if _running.count == len(papers) and papers:
+        return _running.h_index()
+    if njit is not None:
+        return int(_h_index_kernel(get_paper_store(papers).cits))
+    n = len(papers)
+    # Raw int64 buffer: 8 bytes per bucket, no boxed PyLong per slot
+    buckets = array('q', bytes(8 * (n + 1)))
+    for c in papers.values():
+        buckets[c if c < n else n] += 1
+    total = 0
+    for i in range(n, 0, -1):
+        total += buckets[i]
+        if total >= i:
+            return i
+    return 0
+
+
+def h_index_from_sorted(sorted_citations):
+    """
+    Calculate h-index from citations already sorted in descending order.
+    Lets callers that sort for other reasons (e.g. the summary report)
+    reuse that order instead of paying for a second pass over the data.
     """
-    citations = sorted(papers.values(), reverse=True)
     h = 0
-    for i, c in enumerate(citations, start=1):
+    for i, c in enumerate(sorted_citations, start=1):
         if c >= i:
             h = i
+        else:
+            break
     return h
 
 
 def i10_index(papers):
     """
     Calculate i10-index: number of papers with at least 10 citations.
+    One binary search on the cached sorted citation column.
     """
-    return sum(1 for c in papers.values() if c >= 10)
+    if not papers:
+        return 0
+    sorted_cits, _ = get_paper_store(papers).sorted_view()
+    return int(sorted_cits.size - np.searchsorted(sorted_cits, 10, side='left'))
 
 
 def count_above_thresholds(papers, thresholds):
@@ -152,18 +516,79 @@ def count_above_thresholds(papers, thresholds):
     Count papers with citations above each threshold in a list.
     Returns a dictionary {threshold: count}.
     """
-    return {t: sum(1 for c in papers.values() if c >= t) for t in thresholds}
+    store = get_paper_store(papers)
+    # Packed byte lanes when counts and thresholds all fit in uint8;
+    # otherwise binary-search the cached sorted column per threshold.
+    cits_u8 = store.packed_u8()
+    if cits_u8 is not None and all(0 <= t <= 255 for t in thresholds):
+        thr = np.asarray(thresholds, dtype=np.uint8)
+        counts = (cits_u8[None, :] >= thr[:, None]).sum(axis=1)
+    else:
+        sorted_cits, _ = store.sorted_view()
+        thr = np.asarray(thresholds, dtype=np.int64)
+        counts = sorted_cits.size - np.searchsorted(sorted_cits, thr, side='left')
+    return dict(zip(thresholds, counts.tolist()))
+
+
+def top_n_papers(papers, n):
+    """
+    Return the n most cited papers as (name, citations) tuples in
+    descending order. Slices the tail of the cached sorted view, so
+    repeated queries cost O(n) output copying at most.
+    """
+    sorted_cits, sorted_names = get_paper_store(papers).sorted_view()
+    n = min(n, sorted_cits.size)
+    tail = slice(sorted_cits.size - n, sorted_cits.size)
+    return list(zip(sorted_names[tail][::-1].tolist(),
+                    sorted_cits[tail][::-1].tolist()))
+
+
+def compute_outliers(papers):
+    """
+    Find papers more than two standard deviations above or below the
+    mean citation count.
+    Returns (outliers_high, outliers_low) as lists of (name, citations).
+    """
+    if len(papers) < 2:
+        return [], []
+    store = get_paper_store(papers)
+    arr = store.cits
+    mean_val = float(arr.mean())
+    std_dev = float(arr.std(ddof=1))
+    hi_mask, lo_mask = _outlier_masks(arr, mean_val - 2 * std_dev,
+                                      mean_val + 2 * std_dev)
+    outliers_high = [(store.names[i], int(arr[i])) for i in np.flatnonzero(hi_mask)]
+    outliers_low = [(store.names[i], int(arr[i])) for i in np.flatnonzero(lo_mask)]
+    return outliers_high, outliers_low
+
+
+def _normalize_stat(value):
+    """
+    Coerce an integral statistic to int so the report and the menu
+    render the same value (e.g. 7 rather than 7.0).
+    """
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _format_outliers(outliers):
+    """
+    Render a list of (name, citations) outliers for display.
+    """
+    return ', '.join(f'{n}({c})' for n, c in outliers) if outliers else 'None'
 
 
 def get_sorted_papers(papers, mode="citations"):
     """
-    Return a sorted dictionary by 'citations' descending or 'name' ascending.
+    Return (name, citations) tuples sorted by 'citations' descending or
+    'name' ascending. Returning the sorted list directly avoids
+    rebuilding a whole dict that callers would only iterate again.
     """
     if mode == "citations":
-        return dict(sorted(papers.items(), key=lambda x: x[1], reverse=True))
+        return sorted(papers.items(), key=lambda x: x[1], reverse=True)
     elif mode == "name":
-        return dict(sorted(papers.items(), key=lambda x: x[0]))
-    return papers
+        return sorted(papers.items(), key=lambda x: x[0])
+    return list(papers.items())
 
 
 def generate_summary_report(papers):
@@ -180,28 +605,28 @@ def generate_summary_report(papers):
     if not papers:
         return "No papers available.\n"
 
-    values = list(papers.values())
-    total_papers = len(values)
-    total_citations = sum(values)
-    avg_citations = round(mean(values), 2)
-    median_citations = median(values)
-    max_cit = max(values)
-    min_cit = min(values)
-    h_idx = h_index(papers)
+    # Single NumPy array: all reductions below run as C loops instead of
+    # one Python-level pass per statistic.
+    store = get_paper_store(papers)
+    arr = store.cits
+    names = store.names
+    total_papers = len(papers)
+
+    # Sort once; the same order feeds both the h-index and the table below.
+    sorted_items = sorted(papers.items(), key=lambda x: x[1], reverse=True)
+
+    total_citations = int(arr.sum())
+    mean_val = total_citations / total_papers
+    avg_citations = _normalize_stat(round(mean_val, 2))
+    median_citations = _normalize_stat(np.median(arr))
+    max_cit = int(arr.max())
+    min_cit = int(arr.min())
+    h_idx = h_index_from_sorted([c for _, c in sorted_items])
     i10_idx = i10_index(papers)
     range_cit = max_cit - min_cit
-    zero_cit = [name for name, c in papers.items() if c == 0]
-
-    # Detect outliers
-    outliers_high, outliers_low = [], []
-    if total_papers > 1:
-        std_dev = stdev(values)
-        mean_val = mean(values)
-        for name, cit in papers.items():
-            if cit > mean_val + 2 * std_dev:
-                outliers_high.append((name, cit))
-            elif cit < mean_val - 2 * std_dev:
-                outliers_low.append((name, cit))
+    zero_cit = names[arr == 0].tolist()
+
+    outliers_high, outliers_low = compute_outliers(papers)
 
     # Build report
     report = []
@@ -217,14 +642,13 @@ def generate_summary_report(papers):
     report.append(f"Min Citations      : {min_cit}")
     report.append(f"Range              : {range_cit}")
     report.append(f"Zero-Citation Papers: {', '.join(zero_cit) if zero_cit else 'None'}")
-    report.append(f"High Outliers (>2σ): {', '.join([f'{n}({c})' for n, c in outliers_high]) if outliers_high else 'None'}")
-    report.append(f"Low Outliers (<2σ) : {', '.join([f'{n}({c})' for n, c in outliers_low]) if outliers_low else 'None'}")
+    report.append(f"High Outliers (>2σ): {_format_outliers(outliers_high)}")
+    report.append(f"Low Outliers (<2σ) : {_format_outliers(outliers_low)}")
     report.append("\nAll Papers Descending by Citations:")
-    sorted_papers = get_sorted_papers(papers)
     report.append(f"{'S.No':<5} {'Paper Name':<35} {'Citations':>10}")
     report.append("-" * 50)
-    for i, (name, cit) in enumerate(sorted_papers.items(), start=1):
-        report.append(f"{i:<5} {name:<35} {cit:>10}")
+    report.extend(_ROW_FMT % (i, name, cit)
+                  for i, (name, cit) in enumerate(sorted_items, start=1))
     return "\n".join(report)
 
 
@@ -249,15 +673,20 @@ def edit_paper(papers):
     match action:
         case 'edit':
             new_cit = get_int(f"Enter new citation count for '{name}': ", min_val=0)
+            _running.update(papers[name], new_cit)
             papers[name] = new_cit
+            bump_papers_version()
             print("Updated successfully.\n")
         case 'rename':
             new_name = input("Enter new name: ").strip()
             if new_name:
                 papers[new_name] = papers.pop(name)
+                bump_papers_version()
                 print("Renamed successfully.\n")
         case 'delete':
+            _running.remove(papers[name])
             del papers[name]
+            bump_papers_version()
             print("Deleted successfully.\n")
         case _:
             print("Invalid action.\n")
@@ -295,10 +724,141 @@ def index_menu(papers):
 # ======= Statistics Menu =====================
 # ==============================================
 
+def _menu_max(papers):
+    print(f"\nMax Citations: {get_running_stats(papers).maximum()}\n")
+
+
+def _menu_min(papers):
+    print(f"\nMin Citations: {get_running_stats(papers).minimum()}\n")
+
+
+def _menu_max_min(papers):
+    stats = get_running_stats(papers)
+    print(f"\nMax: {stats.maximum()} | Min: {stats.minimum()}\n")
+
+
+def _menu_average(papers):
+    avg = _normalize_stat(round(get_running_stats(papers).mean, 2))
+    print(f"\nAverage Citations: {avg}\n")
+
+
+def _menu_median(papers):
+    med = _cached('median', lambda: _normalize_stat(median(array('q', papers.values()))))
+    print(f"\nMedian Citations: {med}\n")
+
+
+def _menu_zero_citations(papers):
+    store = get_paper_store(papers)
+    zero_cits = store.names[store.cits == 0].tolist()
+    print(f"\nZero-Citation Papers: {', '.join(zero_cits) if zero_cits else 'None'}\n")
+
+
+def _menu_thresholds(papers):
+    thr_input = input("\nEnter thresholds separated by commas (e.g., 10,25,50): ")
+    thresholds = [int(t.strip()) for t in thr_input.split(',') if t.strip().isdigit()]
+    counts = count_above_thresholds(papers, thresholds)
+    print("\nCounts above thresholds:")
+    for t, c in counts.items():
+        print(f">= {t:>3}: {c}")
+    print()
+
+
+def _menu_range_filter(papers):
+    low = get_int("\nEnter minimum citation: ", 0)
+    high = get_int("Enter maximum citation: ", low)
+    sorted_cits, sorted_names = get_paper_store(papers).sorted_view()
+    lo = np.searchsorted(sorted_cits, low, side='left')
+    hi = np.searchsorted(sorted_cits, high, side='right')
+    filtered = dict(zip(sorted_names[lo:hi].tolist(),
+                        sorted_cits[lo:hi].tolist()))
+    print_paper_list(filtered, title=f"Papers with citations {low}-{high}")
+
+
+def _menu_top_n(papers):
+    N = get_int("\nEnter N for Top N papers: ", 1)
+    top_n = top_n_papers(papers, N)
+    print_paper_list(dict(top_n), title=f"Top {N} Most Cited Papers")
+
+
+def _menu_summary(papers):
+    report = _cached('summary', lambda: generate_summary_report(papers))
+    # One write for the whole dump instead of per-print flushes
+    sys.stdout.write(report + "\n\n")
+
+
+def _menu_export_list(papers):
+    if get_yes_no("\nDo you want to save the citation list to TXT? (y/n): ") == 'y':
+        filename = input("Enter filename (e.g., list.txt): ").strip()
+        save_papers_to_txt(papers, filename)
+
+
+def _menu_export_summary(papers):
+    if get_yes_no("\nDo you want to save the summary report to TXT? (y/n): ") == 'y':
+        filename = input("Enter filename (e.g., summary.txt): ").strip()
+        try:
+            with open(filename, 'w') as f:
+                f.write(generate_summary_report(papers))
+            print(f"Summary report saved to '{filename}' successfully.\n")
+        except Exception as e:
+            print(f"Error saving summary: {e}\n")
+
+
+def _menu_edit(papers):
+    edit_paper(papers)
+
+
+def _menu_load(papers):
+    filename = input("\nEnter filename to load citations from (e.g., list.txt): ").strip()
+    loaded = load_papers_from_txt(filename)
+    for name, cit in loaded.items():
+        if name in papers:
+            _running.update(papers[name], cit)
+        else:
+            _running.add(cit)
+        papers[name] = cit
+    if loaded:
+        bump_papers_version()
+
+
+def _menu_save(papers):
+    filename = input("\nEnter filename to save citations (e.g., list.txt): ").strip()
+    save_papers_to_txt(papers, filename)
+
+
+def _menu_outliers(papers):
+    outliers_high, outliers_low = compute_outliers(papers)
+    print("\nOutlier Information:")
+    print(f"High Outliers (>2σ): {_format_outliers(outliers_high)}")
+    print(f"Low Outliers (<2σ) : {_format_outliers(outliers_low)}")
+    print()
+
+
+# Jump table: one dict lookup per menu choice instead of a 17-branch
+# match cascade. Choice 17 (exit) is handled in the loop itself.
+_MENU = {
+    1: _menu_max,
+    2: _menu_min,
+    3: _menu_max_min,
+    4: _menu_average,
+    5: _menu_median,
+    6: _menu_zero_citations,
+    7: _menu_thresholds,
+    8: _menu_range_filter,
+    9: _menu_top_n,
+    10: _menu_summary,
+    11: _menu_export_list,
+    12: _menu_export_summary,
+    13: _menu_edit,
+    14: _menu_load,
+    15: _menu_save,
+    16: _menu_outliers,
+}
+
+
 def statistics_menu(papers):
     """
     Main statistics and filters menu.
-    Uses match-case for options.
+    Dispatches choices through the _MENU jump table.
     """
     while True:
         print_divider()
@@ -320,79 +880,16 @@ def statistics_menu(papers):
 
         choice = get_int("Enter choice (1-17): ", 1, 17)
 
-        match choice:
-            case 1:
-                print(f"\nMax Citations: {max(papers.values())}\n")
-            case 2:
-                print(f"\nMin Citations: {min(papers.values())}\n")
-            case 3:
-                print(f"\nMax: {max(papers.values())} | Min: {min(papers.values())}\n")
-            case 4:
-                print(f"\nAverage Citations: {round(mean(papers.values()), 2)}\n")
-            case 5:
-                print(f"\nMedian Citations: {median(papers.values())}\n")
-            case 6:
-                zero_cits = [name for name, c in papers.items() if c == 0]
-                print(f"\nZero-Citation Papers: {', '.join(zero_cits) if zero_cits else 'None'}\n")
-            case 7:
-                thr_input = input("\nEnter thresholds separated by commas (e.g., 10,25,50): ")
-                thresholds = [int(t.strip()) for t in thr_input.split(',') if t.strip().isdigit()]
-                counts = count_above_thresholds(papers, thresholds)
-                print("\nCounts above thresholds:")
-                for t, c in counts.items():
-                    print(f">= {t:>3}: {c}")
-                print()
-            case 8:
-                low = get_int("\nEnter minimum citation: ", 0)
-                high = get_int("Enter maximum citation: ", low)
-                filtered = {name: c for name, c in papers.items() if low <= c <= high}
-                print_paper_list(filtered, title=f"Papers with citations {low}-{high}")
-            case 9:
-                N = get_int("\nEnter N for Top N papers: ", 1)
-                top_n = dict(list(get_sorted_papers(papers).items())[:N])
-                print_paper_list(top_n, title=f"Top {N} Most Cited Papers")
-            case 10:
-                print(generate_summary_report(papers))
-                print()
-            case 11:
-                if get_yes_no("\nDo you want to save the citation list to TXT? (y/n): ") == 'y':
-                    filename = input("Enter filename (e.g., list.txt): ").strip()
-                    save_papers_to_txt(papers, filename)
-            case 12:
-                if get_yes_no("\nDo you want to save the summary report to TXT? (y/n): ") == 'y':
-                    filename = input("Enter filename (e.g., summary.txt): ").strip()
-                    try:
-                        with open(filename, 'w') as f:
-                            f.write(generate_summary_report(papers))
-                        print(f"Summary report saved to '{filename}' successfully.\n")
-                    except Exception as e:
-                        print(f"Error saving summary: {e}\n")
-            case 13:
-                edit_paper(papers)
-            case 14:
-                filename = input("\nEnter filename to load citations from (e.g., list.txt): ").strip()
-                loaded = load_papers_from_txt(filename)
-                papers.update(loaded)
-            case 15:
-                filename = input("\nEnter filename to save citations (e.g., list.txt): ").strip()
-                save_papers_to_txt(papers, filename)
-            case 16:
-                report = generate_summary_report(papers)
-                print("\nOutlier Information:")
-                lines = report.split('\n')
-                for line in lines:
-                    if "Outliers" in line:
-                        print(line)
-                print()
-            case 17:
-                print("Exiting statistics menu...\n")
-                break
-
-        if choice != 17:
-            cont = get_yes_no("Continue in statistics menu? (y/n): ")
-            if cont == 'n':
-                print("Exiting statistics menu...\n")
-                break
+        if choice == 17:
+            print("Exiting statistics menu...\n")
+            break
+
+        _MENU[choice](papers)
+
+        cont = get_yes_no("Continue in statistics menu? (y/n): ")
+        if cont == 'n':
+            print("Exiting statistics menu...\n")
+            break
 
 
 # ==============================================